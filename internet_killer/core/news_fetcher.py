@@ -1,12 +1,35 @@
 import requests
+import csv
 import json
 import os
 import sys
 from dotenv import load_dotenv
 from datetime import datetime, date
-from typing import List, Dict, Optional
-import pandas as pd
-import feedparser
+from typing import ClassVar, List, Dict, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+
+# pandas / feedparser(lxml 파싱 실패 시 대체용)는 import 비용이 커서 실제로 쓰는 곳에서 불러옴
+if TYPE_CHECKING:
+    import pandas as pd
+
+# RSS/Atom 파싱에 쓰는 XML 네임스페이스
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+RSS_CONTENT_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+DC_CREATOR_TAG = "{http://purl.org/dc/elements/1.1/}creator"
+DC_DATE_TAG = "{http://purl.org/dc/elements/1.1/}date"
+
+# orjson이 없으면 표준 json으로 대체 (둘 다 bytes 입력을 받음)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
 
 try:
     from config.settings import settings
@@ -19,7 +42,31 @@ except ImportError:
 
 class GlobalNewsFetcher:
     """NewsAPI를 통해 전세계 뉴스를 수집하고 저장"""
-    
+
+    # 다양한 국가와 카테고리별 NewsAPI 요청 (apiKey를 제외한 파라미터는 미리 계산)
+    _REQUEST_PLANS: ClassVar[List[Dict]] = [
+        # 한국 뉴스
+        {"name": "한국 전체", "country_field": "kr", "params": {"pageSize": 20, "country": "kr"}},
+        {"name": "한국 기술", "country_field": "kr", "params": {"pageSize": 20, "country": "kr", "category": "technology"}},
+        {"name": "한국 경제", "country_field": "kr", "params": {"pageSize": 20, "country": "kr", "category": "business"}},
+        {"name": "한국 연예", "country_field": "kr", "params": {"pageSize": 20, "country": "kr", "category": "entertainment"}},
+
+        # 미국 뉴스
+        {"name": "미국 전체", "country_field": "us", "params": {"pageSize": 20, "country": "us", "language": "en"}},
+        {"name": "미국 기술", "country_field": "us", "params": {"pageSize": 20, "country": "us", "language": "en", "category": "technology"}},
+        {"name": "미국 경제", "country_field": "us", "params": {"pageSize": 20, "country": "us", "language": "en", "category": "business"}},
+        {"name": "미국 정치", "country_field": "us", "params": {"pageSize": 20, "country": "us", "language": "en", "category": "politics"}},
+
+        # 영국 뉴스
+        {"name": "영국 전체", "country_field": "gb", "params": {"pageSize": 20, "country": "gb", "language": "en"}},
+        {"name": "영국 경제", "country_field": "gb", "params": {"pageSize": 20, "country": "gb", "language": "en", "category": "business"}},
+        {"name": "영국 정치", "country_field": "gb", "params": {"pageSize": 20, "country": "gb", "language": "en", "category": "politics"}},
+
+        # 글로벌 주요 소스들
+        {"name": "글로벌 주요 매체", "country_field": "global",
+         "params": {"pageSize": 20, "sources": "bbc-news,cnn,reuters,associated-press,techcrunch", "language": "en"}},
+    ]
+
     def __init__(self):
         self.api_key = settings.NEWS_API_KEY
         self.base_url = "https://newsapi.org/v2"
@@ -27,6 +74,7 @@ class GlobalNewsFetcher:
         self.today_str = date.today().strftime("%Y%m%d")
         self.csv_file = f"{self.data_dir}/news_data_{self.today_str}.csv"
         self.json_file = f"{self.data_dir}/news_data_{self.today_str}.json"
+        self.feed_cache_file = f"{self.data_dir}/feed_etags.json"
         
         self.rss_sources = [
             {"url": "https://feeds.yna.co.kr/news", "name": "연합뉴스", "country": "kr"},
@@ -37,8 +85,22 @@ class GlobalNewsFetcher:
             {"url": "http://rss.cnn.com/rss/edition.rss", "name": "CNN", "country": "us"},
         ]
 
+        # 요청 간 커넥션 재사용 (keep-alive, TLS 핸드셰이크 절약)
+        self.session = requests.Session()
+        self.request_timeout = (3, 7)  # (연결, 읽기) 초 - 응답 없는 호스트는 빨리 포기
+        # 일시적인 오류(429/5xx)는 짧은 백오프로 재시도
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=16, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Accept-Encoding은 requests 기본값 사용 (urllib3가 풀 수 있는 gzip/deflate, brotli 설치 시 br까지)
+        self.session.headers.update({"User-Agent": "ai-media/1.0"})
+
         # 데이터 폴더 생성
         os.makedirs(self.data_dir, exist_ok=True)
+
+        # RSS 조건부 요청용 캐시 ({url: {"etag", "modified", "entries"}})
+        self.feed_cache = self._load_feed_cache()
         
     def check_today_data_exists(self) -> bool:
         """오늘 날짜의 데이터가 이미 있는지 확인"""
@@ -57,165 +119,278 @@ class GlobalNewsFetcher:
             return {"status": "error", "message": "API key missing"}
         
         print(f"🌍 전세계 뉴스 수집 시작... (날짜: {self.today_str})")
-        all_articles = []
-        
-        # 다양한 국가와 카테고리에서 뉴스 수집
-        countries_and_categories = [
-            # 한국 뉴스
-            {"country": "kr", "category": None, "name": "한국 전체"},
-            {"country": "kr", "category": "technology", "name": "한국 기술"},
-            {"country": "kr", "category": "business", "name": "한국 경제"},
-            {"country": "kr", "category": "entertainment", "name": "한국 연예"},
-            
-            # 미국 뉴스  
-            {"country": "us", "category": None, "name": "미국 전체"},
-            {"country": "us", "category": "technology", "name": "미국 기술"},
-            {"country": "us", "category": "business", "name": "미국 경제"},
-            {"country": "us", "category": "politics", "name": "미국 정치"},
-            
-            # 영국 뉴스
-            {"country": "gb", "category": None, "name": "영국 전체"},
-            {"country": "gb", "category": "business", "name": "영국 경제"},
-            {"country": "gb", "category": "politics", "name": "영국 정치"},
-            
-            # 글로벌 주요 소스들
-            {"sources": "bbc-news,cnn,reuters,associated-press,techcrunch", "name": "글로벌 주요 매체"}
-        ]
+        collected_at = datetime.now().isoformat()  # 같은 실행에서 수집된 기사는 같은 시각을 공유
         
-        for config in countries_and_categories:
-            print(f"📰 수집 중: {config['name']}")
-            articles = self._fetch_news_by_config(config)
-            all_articles.extend(articles)
-            
-        print("📡 RSS 피드에서 추가 뉴스 수집...")
-        for rss_config in self.rss_sources:
-            print(f"📰 RSS 수집 중: {rss_config['name']}")
-            rss_articles = self._fetch_rss_news(rss_config)
-            all_articles.extend(rss_articles)
-
-        # 중복 제거 (URL 기준)
-        unique_articles = self._remove_duplicates(all_articles)
-        print(f"✨ 총 {len(unique_articles)}개의 고유한 뉴스를 수집했습니다!")
+        # NewsAPI + RSS 요청을 한 번에 병렬로 실행
+        tasks = [(self._fetch_news_by_config, plan) for plan in self._REQUEST_PLANS]
+        tasks += [(self._fetch_rss_news, rss_config) for rss_config in self.rss_sources]
+
+        # 요청 수만큼 워커를 둬서 모든 요청이 동시에 진행되도록 함
+        # 결과는 요청 순서대로 받아서 CSV에 바로 기록
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            batches = executor.map(lambda task: task[0](task[1], collected_at), tasks)
+            all_articles = self._stream_to_csv(batches)
+
+        self._save_feed_cache()
+
+        print(f"✨ 총 {len(all_articles)}개의 고유한 뉴스를 수집했습니다!")
         
         # 저장
-        self._save_to_files(unique_articles)
+        self._save_json(all_articles)
         
         return {
             "status": "success", 
             "date": self.today_str,
-            "total_articles": len(unique_articles),
+            "total_articles": len(all_articles),
             "files": [self.csv_file, self.json_file]
         }
     
-    def _fetch_news_by_config(self, config: Dict) -> List[Dict]:
-        """설정에 따라 뉴스 가져오기"""
+    def _fetch_news_by_config(self, plan: Dict, collected_at: str) -> List[Dict]:
+        """요청 계획(_REQUEST_PLANS 항목)에 따라 뉴스 가져오기"""
         try:
             url = f"{self.base_url}/top-headlines"
-            params = {
-                "apiKey": self.api_key,
-                "pageSize": 20,  # 각 카테고리당 20개씩
-            }
+            params = {**plan["params"], "apiKey": self.api_key}
 
-            if config.get("country") == "kr":
-                params["country"] = "kr"
-            elif config.get("country") == "gb":
-                params["country"] = "gb"
-                params["language"] = "en"
-            elif "sources" in config:
-                params["sources"] = config["sources"]
-                params["language"] = "en"
-            else:
-                params["country"] = config["country"]
-                params["language"] = "en"
-
-            if config.get("category"):
-                params["category"] = config["category"]
+            print(f"📰 수집 중: {plan['name']} - API 요청: {plan['params']}")
 
-            print(f"🔍 API 요청: {params}")
-
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=self.request_timeout)
             response.raise_for_status()
-            data = response.json()
+            # pageSize=20 응답은 작아서 스트리밍 파싱보다 orjson으로 한 번에 읽는 편이 빠름
+            data = json_loads(response.content)
             
             print(f"📊 응답: {data.get('totalResults', 0)}개 결과")
 
-            articles = []
-            for article in data.get("articles", []):
-                if article["title"] and article["description"]:  # 제목과 내용이 있는 것만
-                    processed_article = {
-                        "id": f"{config['name']}_{len(articles)}",
-                        "title": article["title"],
-                        "description": article["description"],
-                        "content": article.get("content", "")[:1000] + "..." if article.get("content") else "",
-                        "url": article["url"],
-                        "source_name": article["source"]["name"],
-                        "category": config["name"],
-                        "country": config.get("country", "global"),
-                        "published_at": article["publishedAt"],
-                        "collected_at": datetime.now().isoformat(),
-                        "author": article.get("author", "Unknown")
-                    }
-                    articles.append(processed_article)
-                    
+            # 제목과 내용이 있는 것만 골라 한 번에 생성 (id는 걸러진 기사 기준 순번)
+            valid_articles = (a for a in data.get("articles", []) if a["title"] and a["description"])
+            articles = [
+                {
+                    "id": f"{plan['name']}_{i}",
+                    "title": article["title"],
+                    "description": article["description"],
+                    "content": f"{content[:1000]}..." if (content := article.get("content")) else "",
+                    "url": article["url"],
+                    "source_name": article["source"]["name"],
+                    "category": plan["name"],
+                    "country": plan["country_field"],
+                    "published_at": article["publishedAt"],
+                    "collected_at": collected_at,
+                    "author": article.get("author", "Unknown")
+                }
+                for i, article in enumerate(valid_articles)
+            ]
+
             return articles
             
         except Exception as e:
-            print(f"❌ {config['name']} 수집 실패: {str(e)}")
+            print(f"❌ {plan['name']} 수집 실패: {str(e)}")
             return []
     
-    def _fetch_rss_news(self, rss_config: Dict) -> List[Dict]:
+    def _fetch_rss_news(self, rss_config: Dict, collected_at: str) -> List[Dict]:
         """RSS 피드에서 뉴스 가져오기"""
         try:
-            print(f"🔍 RSS 요청: {rss_config['url']}")
-        
-            feed = feedparser.parse(rss_config['url'])
-            articles = []
-        
-            for entry in feed.entries[:10]:  # RSS에서는 10개만
-                processed_article = {
-                    "id": f"{rss_config['name']}_{len(articles)}",
-                    "title": entry.title,
-                    "description": getattr(entry, 'summary', entry.title)[:200] + "...",
-                    "content": getattr(entry, 'content', [{}])[0].get('value', '')[:1000] + "..." if hasattr(entry, 'content') else "",
-                    "url": entry.link,
+            print(f"📰 RSS 수집 중: {rss_config['name']} - {rss_config['url']}")
+
+            # 이전에 받은 ETag / Last-Modified로 조건부 요청 (파싱된 항목이 캐시에 있을 때만)
+            cached = self.feed_cache.get(rss_config['url'], {})
+            headers = {}
+            if cached.get("entries"):
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("modified"):
+                    headers["If-Modified-Since"] = cached["modified"]
+
+            response = self.session.get(rss_config['url'], headers=headers, timeout=self.request_timeout)
+            if response.status_code == 304:
+                entries = cached["entries"]
+                print(f"📊 RSS 변경 없음: {rss_config['name']} (캐시 {len(entries)}개 사용)")
+            else:
+                response.raise_for_status()
+                entries = self._parse_feed_entries(response.content, limit=10)  # RSS에서는 10개만
+                if entries:
+                    self.feed_cache[rss_config['url']] = {
+                        "etag": response.headers.get("ETag"),
+                        "modified": response.headers.get("Last-Modified"),
+                        "entries": entries
+                    }
+                else:
+                    # 빈 결과는 ETag 뒤에 캐시하지 않음 (304가 계속 오면 빈 피드로 고정되므로)
+                    self.feed_cache.pop(rss_config['url'], None)
+                print(f"📊 RSS 응답: {len(entries)}개 결과")
+
+            # 캐시에는 파싱된 항목만 두고, 기사는 매 실행마다 이번 수집 시각으로 생성
+            articles = [
+                {
+                    "id": f"{rss_config['name']}_{i}",
+                    "title": entry["title"],
+                    "description": f"{(entry['summary'] or entry['title'])[:200]}...",
+                    "content": f"{content[:1000]}..." if (content := entry["content"]) else "",
+                    "url": entry["link"],
                     "source_name": rss_config['name'],
                     "category": f"{rss_config['name']} RSS",
                     "country": rss_config['country'],
-                    "published_at": getattr(entry, 'published', datetime.now().isoformat()),
-                    "collected_at": datetime.now().isoformat(),
-                    "author": getattr(entry, 'author', "Unknown")
+                    "published_at": entry["published"] or collected_at,
+                    "collected_at": collected_at,
+                    "author": entry["author"] or "Unknown"
                 }
-                articles.append(processed_article)
-            
-            print(f"📊 RSS 응답: {len(articles)}개 결과")
+                for i, entry in enumerate(entries)
+            ]
+
             return articles
         
         except Exception as e:
             print(f"❌ RSS {rss_config['name']} 수집 실패: {str(e)}")
             return []
     
-    def _remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """URL 기준으로 중복 제거"""
+    def _parse_feed_entries(self, content: bytes, limit: int) -> List[Dict]:
+        """RSS/Atom 피드를 lxml로 앞에서부터 limit개만 파싱 (잘못된 XML이거나 항목을 못 찾으면 feedparser로 대체)"""
+        entries = []
+        try:
+            item_tags = ("item", f"{RSS1_NS}item", f"{ATOM_NS}entry")
+            items = etree.iterparse(BytesIO(content), tag=item_tags, resolve_entities=False)
+            for _, item in items:
+                if item.tag == f"{ATOM_NS}entry":
+                    link = next(
+                        (el.get("href") for el in item.iterfind(f"{ATOM_NS}link") if el.get("rel", "alternate") == "alternate"),
+                        None
+                    )
+                    entry = {
+                        "title": item.findtext(f"{ATOM_NS}title"),
+                        "link": link,
+                        "summary": self._element_text(item.find(f"{ATOM_NS}summary")),
+                        "content": self._element_text(item.find(f"{ATOM_NS}content")),
+                        "published": item.findtext(f"{ATOM_NS}published") or item.findtext(f"{ATOM_NS}updated"),
+                        "author": item.findtext(f"{ATOM_NS}author/{ATOM_NS}name")
+                    }
+                else:
+                    # RSS 2.0은 네임스페이스 없음, RSS 1.0(RDF)은 항목 태그와 같은 네임스페이스 사용
+                    ns = RSS1_NS if item.tag == f"{RSS1_NS}item" else ""
+                    entry = {
+                        "title": item.findtext(f"{ns}title"),
+                        "link": item.findtext(f"{ns}link"),
+                        "summary": item.findtext(f"{ns}description"),
+                        "content": item.findtext(RSS_CONTENT_TAG),
+                        "published": item.findtext("pubDate") or item.findtext(DC_DATE_TAG),
+                        "author": item.findtext(DC_CREATOR_TAG) or item.findtext("author")
+                    }
+                # 다 읽은 항목은 바로 메모리에서 해제
+                item.clear()
+
+                # 제목이나 링크가 없는 항목은 제외
+                if entry["title"] and entry["link"]:
+                    entries.append(entry)
+                    if len(entries) >= limit:
+                        break
+        except etree.XMLSyntaxError:
+            return self._parse_feed_entries_fallback(content, limit)
+
+        # 기본 네임스페이스가 다른 피드 등 lxml로 항목을 못 찾은 경우
+        if not entries:
+            return self._parse_feed_entries_fallback(content, limit)
+
+        return entries
+
+    def _element_text(self, element) -> Optional[str]:
+        """요소의 텍스트 (type="xhtml"처럼 자식 요소로 된 내용도 포함)"""
+        if element is None:
+            return None
+        return "".join(element.itertext()).strip()
+
+    def _parse_feed_entries_fallback(self, content: bytes, limit: int) -> List[Dict]:
+        """lxml이 처리하지 못한 피드를 feedparser로 파싱"""
+        import feedparser
+
+        feed = feedparser.parse(content)
+        entries = []
+        for entry in feed.entries:
+            if not (entry.get("title") and entry.get("link")):
+                continue
+            entries.append({
+                "title": entry.title,
+                "link": entry.link,
+                "summary": entry.get("summary"),
+                "content": entry["content"][0].get("value") if entry.get("content") else None,
+                "published": entry.get("published"),
+                "author": entry.get("author")
+            })
+        return entries[:limit]
+
+    def _load_feed_cache(self) -> Dict:
+        """RSS ETag 캐시 불러오기"""
+        try:
+            if os.path.exists(self.feed_cache_file):
+                with open(self.feed_cache_file, 'rb') as f:
+                    return json_loads(f.read())
+        except Exception as e:
+            print(f"⚠️ RSS 캐시 로드 실패: {str(e)}")
+        return {}
+
+    def _save_feed_cache(self):
+        """RSS ETag 캐시 저장"""
+        cache_tmp = self.feed_cache_file + ".tmp"
+        try:
+            # 임시 파일에 다 쓴 뒤 os.replace로 교체 (중간에 죽어도 깨진 캐시가 남지 않음)
+            with open(cache_tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.feed_cache, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(cache_tmp, self.feed_cache_file)
+        except Exception as e:
+            print(f"⚠️ RSS 캐시 저장 실패: {str(e)}")
+            if os.path.exists(cache_tmp):
+                os.remove(cache_tmp)
+
+    def _stream_to_csv(self, batches) -> List[Dict]:
+        """요청별 기사 묶음을 받는 대로 URL 중복을 걸러 CSV 임시 파일에 기록하고, 끝나면 os.replace로 교체"""
+        all_articles = []
         seen_urls = set()
-        unique_articles = []
-        
-        for article in articles:
-            if article["url"] not in seen_urls:
-                seen_urls.add(article["url"])
-                unique_articles.append(article)
-                
-        return unique_articles
-    
-    def _save_to_files(self, articles: List[Dict]):
-        """CSV와 JSON 파일로 저장"""
+
+        def unique(articles: List[Dict]) -> List[Dict]:
+            # 요청 순서대로 처리하므로 같은 URL은 항상 앞선 요청의 기사가 남음
+            new_articles = []
+            for article in articles:
+                if article["url"] not in seen_urls:
+                    seen_urls.add(article["url"])
+                    new_articles.append(article)
+            return new_articles
+        csv_tmp = self.csv_file + ".tmp"
         try:
-            # DataFrame 생성
-            df = pd.DataFrame(articles)
-            
-            # CSV 저장
-            df.to_csv(self.csv_file, index=False, encoding='utf-8-sig')
-            print(f"✅ CSV 저장 완료: {self.csv_file}")
-            
+            with open(csv_tmp, 'w', newline='', encoding='utf-8-sig', buffering=65536) as f:
+                writer = None
+                for batch in batches:
+                    articles = unique(batch)
+                    all_articles.extend(articles)
+                    if not articles:
+                        continue
+                    if writer is None:
+                        writer = csv.DictWriter(f, fieldnames=list(articles[0].keys()))
+                        writer.writeheader()
+                    writer.writerows(articles)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if writer is None:
+                os.remove(csv_tmp)
+                print("❌ 수집된 뉴스가 없어 CSV를 저장하지 않았습니다.")
+            else:
+                os.replace(csv_tmp, self.csv_file)
+                print(f"✅ CSV 저장 완료: {self.csv_file}")
+
+        except Exception as e:
+            print(f"❌ 파일 저장 실패: {str(e)}")
+            # CSV 저장이 실패해도 나머지 수집 결과는 JSON으로 저장할 수 있도록 받아둠
+            for batch in batches:
+                all_articles.extend(unique(batch))
+            if os.path.exists(csv_tmp):
+                os.remove(csv_tmp)
+
+        return all_articles
+
+    def _save_json(self, articles: List[Dict]):
+        """JSON 파일로 저장 (CSV는 수집 중에 이미 기록됨)"""
+        try:
+            # 임시 파일에 다 쓴 뒤 os.replace로 교체 (중간에 죽어도 깨진 파일이 남지 않음)
+            json_tmp = self.json_file + ".tmp"
+
             # JSON 저장 (메타데이터 포함)
             json_data = {
                 "collection_date": self.today_str,
@@ -224,18 +399,32 @@ class GlobalNewsFetcher:
                 "articles": articles
             }
             
-            with open(self.json_file, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(json_tmp, 'wb') as f:
+                    f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                with open(json_tmp, 'w', encoding='utf-8') as f:
+                    json.dump(json_data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(json_tmp, self.json_file)
             print(f"✅ JSON 저장 완료: {self.json_file}")
             
         except Exception as e:
             print(f"❌ 파일 저장 실패: {str(e)}")
     
-    def load_today_data(self) -> Optional[pd.DataFrame]:
-        """오늘 저장된 데이터를 불러오기"""
+    def load_today_data(self, summary_only: bool = False) -> Optional["pd.DataFrame"]:
+        """오늘 저장된 데이터를 불러오기 (summary_only면 category 컬럼만)"""
+        import pandas as pd
+
         try:
             if os.path.exists(self.csv_file):
-                df = pd.read_csv(self.csv_file)
+                if summary_only:
+                    df = pd.read_csv(self.csv_file, usecols=['category'], dtype={'category': 'category'})
+                else:
+                    df = pd.read_csv(self.csv_file)
                 print(f"📊 불러온 데이터: {len(df)}개 뉴스")
                 return df
             else:
@@ -259,7 +448,7 @@ if __name__ == "__main__":
         print(f"\n🎉 수집 완료! 총 {result['total_articles']}개의 뉴스를 저장했습니다.")
         
         # 저장된 데이터 미리보기
-        df = fetcher.load_today_data()
+        df = fetcher.load_today_data(summary_only=True)
         if df is not None:
             print("\n📋 수집된 뉴스 카테고리별 통계:")
             category_stats = df['category'].value_counts()